@@ -4,20 +4,21 @@
 Script de automação para verificação de sites WordPress com diversas funcionalidades,
 utilizando a biblioteca Rich para exibir resultados de forma elegante e profissional.
 O script cria um ambiente virtual (se necessário) e instala as dependências 
-(requests, beautifulsoup4, rich, selenium, webdriver-manager).
+(requests, selectolax, rich, selenium).
 
 Funcionalidades:
   - Cria ambiente virtual automaticamente (pasta "venv") e instala dependências se necessário.
-  - Garante que o screenshot da página inicial seja capturado usando Selenium (em modo headless).
+  - Garante que o screenshot da página inicial seja capturado pelo Chrome headless (linha de comando,
+    ou Selenium quando o Chrome não está no PATH).
   - Exibe uma barra de progresso geral baseada no número total de verificações (16 passos por site),
     atualizando a descrição para indicar qual site e qual passo está sendo executado.
   - Realiza diversas verificações:
-      1. Verificar disponibilidade do site (usando 5 métodos);
+      1. Verificar disponibilidade do site (até 4 métodos, parando no primeiro que funcionar);
       2. Medir tempo de resposta;
       3. Verificar redirecionamentos;
       4. Verificar certificado SSL (se HTTPS);
       5. Verificar DNS;
-      6. Executar teste de ping;
+      6. Executar teste de ping (conexão TCP nas portas 443/80);
       7. Obter Content-Type;
       8. Extrair título da página;
       9. Verificar padrões de erro no conteúdo;
@@ -53,38 +54,98 @@ if not in_virtualenv():
     else:
         python_executable = os.path.join(venv_dir, "bin", "python")
     subprocess.check_call([python_executable, "-m", "pip", "install", "--upgrade", "pip"])
-    # Instala as dependências necessárias, agora incluindo selenium e webdriver-manager
-    subprocess.check_call([python_executable, "-m", "pip", "install", "requests", "beautifulsoup4", "rich", "selenium", "webdriver-manager"])
+    # Instala as dependências necessárias, incluindo o selenium (o ChromeDriver é obtido pelo Selenium Manager)
+    subprocess.check_call([python_executable, "-m", "pip", "install", "requests", "selectolax", "rich", "selenium"])
     subprocess.check_call([python_executable] + sys.argv)
     sys.exit()
 
 # ==================== Parte 2: Importações e Configurações ====================
+import atexit
 import time
 import socket
 import ssl
 import hashlib
+import re
+import shutil
+import tempfile
 import datetime
+import functools
+import inspect
+import queue
+import threading
 from urllib.parse import urlparse
 import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ReadTimeoutError
+from selectolax.lexbor import LexborHTMLParser
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 
-# Importa Selenium e WebDriver Manager para capturar o screenshot
+# Importa o Selenium, usado para o screenshot quando o Chrome não está no PATH
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from webdriver_manager.chrome import ChromeDriverManager
+from selenium.webdriver.chrome.service import Service
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import TimeoutException
 
 console = Console()
 
 LINKS_FILE = "links.txt"
 BASE_DOWNLOAD_FOLDER = "dominios"
 
+# Sessões HTTP com pool de conexões: reaproveitam conexões TCP/TLS entre as verificações do mesmo host
+# (uma por thread: requests.Session não é garantidamente thread-safe)
+_LOCAL = threading.local()
+_SESSOES = []
+_SESSOES_LOCK = threading.Lock()
+
+def get_session():
+    """Retorna a sessão HTTP da thread atual, criando-a no primeiro uso."""
+    session = getattr(_LOCAL, "session", None)
+    if session is None:
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers["User-Agent"] = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+        _LOCAL.session = session
+        with _SESSOES_LOCK:
+            _SESSOES.append(session)
+    return session
+
+def fechar_sessoes():
+    with _SESSOES_LOCK:
+        sessoes, _SESSOES[:] = list(_SESSOES), []
+    for session in sessoes:
+        session.close()
+
+# Timeouts curtos para que sites fora do ar falhem rápido: (conexão, leitura) em segundos
+TIMEOUT = (2, 3)
+SOCKET_TIMEOUT = 2
+PING_TIMEOUT = 1.5
+
+# Limites de download da página inicial
+MAX_ANALISE_BYTES = 512 * 1024      # suficiente para título, metas e marcadores do WordPress
+MAX_VERSAO_BYTES = 2 * 1024 * 1024  # páginas maiores não entram no controle de versões
+
+# Concorrência: sites processados em paralelo e executores para as verificações bloqueantes
+MAX_SITES_SIMULTANEOS = 20
+TOTAL_PASSOS = 16
+PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=64)
+# O Chrome é pesado: no máximo SCREENSHOT_WORKERS prints simultâneos, em paralelo às demais verificações
+SCREENSHOT_WORKERS = 4
+SCREENSHOT_EXECUTOR = ThreadPoolExecutor(max_workers=SCREENSHOT_WORKERS)
+CHROME_BINARIOS = ("google-chrome", "google-chrome-stable", "chromium", "chromium-browser", "chrome")
+CHROMEDRIVER_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "verifica-sites", "chromedriver_path")
+
 # ==================== Funções Auxiliares de Armazenamento ====================
 def criar_pastas_necessarias(dominio):
     if not os.path.exists(BASE_DOWNLOAD_FOLDER):
@@ -95,123 +156,239 @@ def criar_pastas_necessarias(dominio):
     return dominio_path
 
 def calcular_hash(conteudo):
-    md5 = hashlib.md5()
-    md5.update(conteudo)
-    return md5.hexdigest()
-
-def contar_versoes(dominio_path, data_base):
-    contador = 0
-    for arquivo in os.listdir(dominio_path):
-        if arquivo.startswith(data_base) and arquivo.endswith(".html"):
-            contador += 1
-    return contador
-
-def get_last_version_file(dominio_path, data_base):
-    versoes = []
-    for arquivo in os.listdir(dominio_path):
-        if arquivo.startswith(data_base) and arquivo.endswith(".html"):
-            if arquivo == f"{data_base}.html":
-                versoes.append((0, arquivo))
-            else:
-                try:
-                    sufixo = arquivo.replace(data_base + "_", "").replace(".html", "")
-                    versoes.append((int(sufixo), arquivo))
-                except Exception:
-                    continue
-    if not versoes:
-        return None
-    versoes.sort(key=lambda x: x[0])
-    return versoes[-1][1]
+    return hashlib.blake2b(conteudo, digest_size=16).digest()
+
+def ler_hash_salvo(caminho_arquivo):
+    """
+    Retorna o hash de uma versão salva, lido do arquivo auxiliar ".b2" gravado junto a ela.
+    Versões antigas, sem o arquivo auxiliar, têm o hash calculado a partir do HTML.
+    """
+    try:
+        with open(caminho_arquivo + ".b2", "rb") as f:
+            return f.read()
+    except OSError:
+        with open(caminho_arquivo, "rb") as f:
+            return calcular_hash(f.read())
+
+@dataclass
+class VersionScan:
+    """Resumo das versões salvas em um dia: quantidade e dados da versão mais recente."""
+    count: int = 0
+    last_name: Optional[str] = None
+    last_suffix: int = -1
+    last_mtime: Optional[float] = None
+
+def scan_versions(dominio_path, data_base):
+    """
+    Percorre a pasta do domínio uma única vez (os.scandir) contando as versões do dia
+    ("AAAA-MM-DD.html", "AAAA-MM-DD_N.html") e localizando a de maior sufixo.
+    """
+    padrao = re.compile(rf'^{re.escape(data_base)}(?:_(\d+))?\.html$')
+    scan = VersionScan()
+    ultima_entrada = None
+    with os.scandir(dominio_path) as it:
+        for entry in it:
+            m = padrao.match(entry.name)
+            if not m:
+                continue
+            scan.count += 1
+            sufixo = int(m.group(1)) if m.group(1) else 0
+            if sufixo > scan.last_suffix:
+                scan.last_name, scan.last_suffix = entry.name, sufixo
+                ultima_entrada = entry
+    if ultima_entrada is not None:
+        scan.last_mtime = ultima_entrada.stat().st_mtime
+    return scan
+
+def gravar_atomico(caminho, dados, sincronizar=True):
+    """
+    Grava os dados em um arquivo temporário e o renomeia para o destino com os.replace,
+    de modo que uma interrupção no meio da gravação nunca deixa um arquivo truncado.
+    """
+    tmp = caminho + ".tmp"
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+    try:
+        try:
+            restante = memoryview(dados)
+            while restante:
+                restante = restante[os.write(fd, restante):]
+            if sincronizar:
+                os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, caminho)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+# Um lock por pasta de domínio: só links do mesmo domínio disputam o nome da próxima versão
+# e o arquivo do print (dominios/<domínio>/print/homepage.png)
+_VERSOES_LOCKS = {}
+_VERSOES_LOCKS_LOCK = threading.Lock()
+
+def lock_do_dominio(dominio_path):
+    with _VERSOES_LOCKS_LOCK:
+        return _VERSOES_LOCKS.setdefault(dominio_path, threading.Lock())
 
 def salvar_conteudo(dominio_path, conteudo):
     """
     Salva o conteúdo baixado em um arquivo dentro da pasta do domínio.
     Se já existir um arquivo para o dia corrente, verifica:
       - Se o último arquivo foi salvo há menos de 10 minutos, NÃO cria nova versão.
-      - Caso contrário, compara o hash do conteúdo atual com o último salvo.
+      - Caso contrário, compara o conteúdo atual com o último salvo (tamanho e, se igual, hash).
         Se forem idênticos, não cria nova versão; se diferentes, cria nova versão com sufixo incremental.
+    O hash de cada versão salva é gravado em um arquivo auxiliar ".b2" para evitar reler o HTML.
     Retorna uma tupla (nome_do_arquivo_salvo ou None, número_total_de_versões).
     """
-    hoje = datetime.datetime.now().strftime("%Y-%m-%d")
-    now = time.time()
-    threshold = 600  # 10 minutos
-    ultimo_arquivo = get_last_version_file(dominio_path, hoje)
-    if ultimo_arquivo:
-        caminho_ultimo = os.path.join(dominio_path, ultimo_arquivo)
-        mod_time = os.path.getmtime(caminho_ultimo)
-        if now - mod_time < threshold:
-            return None, contar_versoes(dominio_path, hoje)
-        with open(caminho_ultimo, "rb") as f:
-            conteudo_existente = f.read()
-        if calcular_hash(conteudo_existente) == calcular_hash(conteudo):
-            return None, contar_versoes(dominio_path, hoje)
+    # Links diferentes do mesmo domínio podem ser processados ao mesmo tempo
+    with lock_do_dominio(dominio_path):
+        hoje = datetime.datetime.now().strftime("%Y-%m-%d")
+        versoes = scan_versions(dominio_path, hoje)
+        if conteudo is None:
+            return None, versoes.count
+        now = time.time()
+        threshold = 600  # 10 minutos
+        hash_novo = None
+        if versoes.last_name:
+            caminho_ultimo = os.path.join(dominio_path, versoes.last_name)
+            if now - versoes.last_mtime < threshold:
+                return None, versoes.count
+            # Tamanhos diferentes já indicam conteúdo diferente, sem precisar ler a versão salva
+            if os.path.getsize(caminho_ultimo) == len(conteudo):
+                hash_novo = calcular_hash(conteudo)
+                if ler_hash_salvo(caminho_ultimo) == hash_novo:
+                    return None, versoes.count
+            novo_nome = f"{hoje}_{versoes.last_suffix + 1}.html"
         else:
-            if ultimo_arquivo == f"{hoje}.html":
-                novo_nome = f"{hoje}_1.html"
-            else:
-                try:
-                    sufixo = ultimo_arquivo.replace(hoje + "_", "").replace(".html", "")
-                    novo_nome = f"{hoje}_{int(sufixo) + 1}.html"
-                except Exception:
-                    novo_nome = f"{hoje}_1.html"
-            caminho_arquivo = os.path.join(dominio_path, novo_nome)
-    else:
-        novo_nome = f"{hoje}.html"
+            novo_nome = f"{hoje}.html"
         caminho_arquivo = os.path.join(dominio_path, novo_nome)
-    with open(caminho_arquivo, "wb") as f:
-        f.write(conteudo)
-    return novo_nome, contar_versoes(dominio_path, hoje)
+        gravar_atomico(caminho_arquivo, conteudo)
+        if hash_novo is None:
+            hash_novo = calcular_hash(conteudo)
+        # O hash pode ser recalculado a partir do HTML, então dispensa o fsync
+        gravar_atomico(caminho_arquivo + ".b2", hash_novo, sincronizar=False)
+        return novo_nome, versoes.count + 1
 
 # ==================== Funções de Verificação Geral ====================
-def verificar_site(url):
-    resultados = []
-    conteudo = None
-    try:
-        r1 = requests.get(url, timeout=10)
-        resultados.append(r1.status_code == 200)
-        if r1.status_code == 200 and conteudo is None:
-            conteudo = r1.content
-    except Exception:
-        resultados.append(False)
-    try:
-        r2 = requests.head(url, timeout=10)
-        resultados.append(r2.status_code < 400)
-    except Exception:
-        resultados.append(False)
-    try:
-        headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64)'}
-        r3 = requests.get(url, headers=headers, timeout=10)
-        resultados.append(r3.status_code == 200)
-        if r3.status_code == 200 and conteudo is None:
-            conteudo = r3.content
-    except Exception:
-        resultados.append(False)
+def eh_timeout(erro):
+    """
+    Indica se a falha foi um timeout. Timeouts durante a leitura do corpo não chegam como
+    requests.exceptions.Timeout: o requests embrulha o ReadTimeoutError em ConnectionError.
+    """
+    if isinstance(erro, requests.exceptions.Timeout):
+        return True
+    if isinstance(erro, requests.exceptions.ConnectionError):
+        return any(isinstance(causa, ReadTimeoutError) for causa in (*erro.args, erro.__context__))
+    return False
+
+def registrar_timeout(etapa, alvo):
+    """Registra um timeout separadamente das demais falhas, para facilitar o diagnóstico."""
+    console.log(f"[yellow]Tempo esgotado ({etapa}): {alvo}[/yellow]")
+
+@dataclass
+class HomepageResult:
+    """Dados da página inicial obtidos em uma única requisição e reaproveitados pelas verificações."""
+    online: bool = False
+    content: Optional[bytes] = None
+    complete: bool = False  # True se `content` é o corpo inteiro (pode ser salvo como versão)
+    resp_time: Optional[float] = None
+    redir_chain: List[str] = field(default_factory=list)
+    content_type: str = "N/A"
+    status: Optional[int] = None
+
+def ler_corpo(r, limite):
+    """
+    Lê o corpo de uma resposta em streaming, parando ao passar de `limite` bytes.
+    Retorna (conteúdo, corpo_completo).
+    """
+    partes = []
+    total = 0
+    for parte in r.iter_content(chunk_size=64 * 1024):
+        partes.append(parte)
+        total += len(parte)
+        if total > limite:
+            return b"".join(partes)[:MAX_ANALISE_BYTES], False
+    return b"".join(partes), True
+
+def fetch_homepage(session, url, headers=None):
+    """
+    Baixa a página inicial uma única vez (seguindo redirecionamentos) e extrai dela
+    conteúdo, tempo de resposta, cadeia de redirecionamentos e Content-Type.
+    O download é limitado: páginas com mais de MAX_VERSAO_BYTES são lidas só até
+    MAX_ANALISE_BYTES, o bastante para título, metas e marcadores do WordPress.
+    """
     try:
-        url_barra = url if url.endswith("/") else url + "/"
-        r4 = requests.get(url_barra, timeout=10)
-        resultados.append(r4.status_code == 200)
-        if r4.status_code == 200 and conteudo is None:
-            conteudo = r4.content
-    except Exception:
-        resultados.append(False)
+        r = session.get(url, headers=headers, allow_redirects=True, timeout=TIMEOUT, stream=True)
+        try:
+            online = r.status_code == 200
+            content, complete = None, False
+            if online:
+                tamanho = r.headers.get("Content-Length", "")
+                if tamanho.isdigit() and int(tamanho) > MAX_VERSAO_BYTES:
+                    limite = MAX_ANALISE_BYTES
+                else:
+                    limite = MAX_VERSAO_BYTES
+                content, complete = ler_corpo(r, limite)
+        finally:
+            r.close()
+    except Exception as e:
+        if eh_timeout(e):
+            registrar_timeout("página inicial", url)
+        return HomepageResult()
+    return HomepageResult(
+        online=online,
+        content=content,
+        complete=complete,
+        resp_time=r.elapsed.total_seconds(),
+        redir_chain=[h.url for h in r.history],
+        content_type=r.headers.get("Content-Type", "N/A"),
+        status=r.status_code,
+    )
+
+def check_socket(url):
+    """Verifica se ao menos as portas web (80/443) do host aceitam conexão."""
     try:
         parsed = urlparse(url)
         hostname = parsed.netloc if parsed.netloc else parsed.path
-        sucesso_socket = False
         for port in [80, 443]:
             try:
-                sock = socket.create_connection((hostname, port), timeout=10)
+                sock = conectar(hostname, port)
                 sock.close()
-                sucesso_socket = True
-                break
+                return True
             except Exception:
                 continue
-        resultados.append(sucesso_socket)
     except Exception:
-        resultados.append(False)
-    online = any(resultados)
-    return online, conteudo
+        pass
+    return False
+
+def verificar_site(url):
+    """
+    Verifica a disponibilidade do site tentando os métodos abaixo, em ordem, e parando
+    no primeiro que funcionar:
+      1. GET com User-Agent de navegador (padrão da sessão);
+      2. GET com o User-Agent padrão do requests;
+      3. GET com barra final na URL;
+      4. Conexão direta (socket) nas portas 80/443.
+    Retorna o HomepageResult da tentativa que respondeu (ou da primeira, se nenhuma respondeu).
+    """
+    tentativas = [(url, None), (url, {"User-Agent": requests.utils.default_user_agent()})]
+    url_barra = url if url.endswith("/") else url + "/"
+    if url_barra != url:
+        tentativas.append((url_barra, None))
+    primeira = None
+    for alvo, headers in tentativas:
+        homepage = fetch_homepage(get_session(), alvo, headers)
+        if homepage.online:
+            return homepage
+        if primeira is None:
+            primeira = homepage
+    primeira.online = check_socket(url)
+    return primeira
 
+@functools.lru_cache(maxsize=4096)
 def extrair_dominio(url):
     parsed_url = urlparse(url)
     dominio = parsed_url.netloc
@@ -221,6 +398,14 @@ def extrair_dominio(url):
         dominio = dominio[4:]
     return dominio
 
+@functools.lru_cache(maxsize=4096)
+def base_url(url):
+    """Retorna esquema e host da URL (ex.: "https://exemplo.com"); sem esquema, assume http."""
+    if not url.startswith("http"):
+        url = "http://" + url
+    parsed = urlparse(url)
+    return f"{parsed.scheme}://{parsed.netloc}"
+
 def ler_links(arquivo):
     if not os.path.exists(arquivo):
         console.print(f"[red]Arquivo de links '{arquivo}' não encontrado![/red]")
@@ -234,100 +419,139 @@ def ler_links(arquivo):
     return links
 
 # ==================== Funções Adicionais de Verificação ====================
-def check_response_time(url):
-    try:
-        start = time.time()
-        r = requests.get(url, timeout=10)
-        response_time = time.time() - start
-        return response_time, r
-    except Exception:
-        return None, None
+def check_response_time(homepage):
+    return homepage.resp_time
 
-def check_redirection_chain(url):
-    try:
-        r = requests.get(url, allow_redirects=True, timeout=10)
-        chain = [resp.url for resp in r.history]
-        return chain
-    except Exception:
-        return []
+def check_redirection_chain(homepage):
+    return homepage.redir_chain
 
 def check_ssl_certificate(host, port=443):
     context = ssl.create_default_context()
     try:
-        with socket.create_connection((host, port), timeout=10) as sock:
+        with conectar(host, port) as sock:
             with context.wrap_socket(sock, server_hostname=host) as ssock:
                 cert = ssock.getpeercert()
                 expiry = cert.get('notAfter')
                 return True, expiry
+    except socket.timeout:
+        registrar_timeout("certificado SSL", host)
+        return False, None
     except Exception:
         return False, None
 
+@functools.lru_cache(maxsize=1024)
+def resolve(host):
+    """
+    Resolve o host (IPv4 e IPv6) uma única vez por execução; as demais verificações
+    reaproveitam o resultado.
+    """
+    infos = socket.getaddrinfo(host, None, type=socket.SOCK_STREAM)
+    return tuple(dict.fromkeys(info[4][0] for info in infos))
+
+def conectar(host, port):
+    """
+    Abre uma conexão TCP usando os endereços em cache de resolve(), tentando cada um
+    até que algum responda (como socket.create_connection faz com o getaddrinfo).
+    """
+    erro = None
+    for ip in resolve(host):
+        try:
+            return socket.create_connection((ip, port), timeout=SOCKET_TIMEOUT)
+        except OSError as e:
+            erro = e
+    raise erro if erro is not None else OSError(f"Nenhum endereço encontrado para {host}")
+
 def check_dns_resolution(dominio):
     try:
-        ip_list = socket.gethostbyname_ex(dominio)[2]
+        ip_list = list(resolve(dominio))
         return ip_list
     except Exception:
         return []
 
-def ping_host(dominio):
+async def ping_host(dominio):
+    """
+    Teste de alcance sem o comando "ping" do sistema: tenta abrir uma conexão TCP
+    nas portas 443 e 80, no próprio loop de eventos, usando os endereços em cache de resolve().
+    """
+    loop = asyncio.get_running_loop()
     try:
-        param = '-n' if os.name == 'nt' else '-c'
-        command = ['ping', param, '1', dominio]
-        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-        return result.returncode == 0
+        ips = await loop.run_in_executor(PROBE_EXECUTOR, resolve, dominio)
     except Exception:
         return False
+    for port in (443, 80):
+        for ip in ips:
+            try:
+                _, writer = await asyncio.wait_for(asyncio.open_connection(ip, port), PING_TIMEOUT)
+            except Exception:
+                continue
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except Exception:
+                pass
+            return True
+    return False
 
-def get_content_type(response):
-    if response is not None:
-        return response.headers.get('Content-Type', 'N/A')
-    return 'N/A'
+def get_content_type(homepage):
+    return homepage.content_type
 
-def get_page_title(content):
+def parse_html(content):
+    """Faz o parse do HTML uma única vez; a árvore resultante é compartilhada pelas verificações."""
+    if not content:
+        return None
     try:
-        soup = BeautifulSoup(content, 'html.parser')
-        title = soup.title.string.strip() if soup.title and soup.title.string else 'N/A'
-        return title
+        return LexborHTMLParser(content)
     except Exception:
-        return 'N/A'
+        return None
 
-def check_error_patterns(content):
-    error_keywords = ["404", "not found", "error", "503", "maintenance"]
+def get_page_title(tree):
     try:
-        text = content.decode('utf-8', errors='ignore').lower()
+        title = tree.css_first("title")
+        texto = title.text().strip() if title is not None else ""
+        return texto if texto else 'N/A'
     except Exception:
-        text = ""
-    errors_found = [word for word in error_keywords if word in text]
-    return errors_found
+        return 'N/A'
+
+ERROR_KEYWORDS = ["404", "not found", "error", "503", "maintenance"]
+# Uma única passada sobre os bytes, sem decodificar nem copiar o HTML em minúsculas
+_ERR_RE = re.compile(b"(?i)(" + b"|".join(re.escape(k.encode()) for k in ERROR_KEYWORDS) + b")")
+
+def check_error_patterns(content):
+    if not content:
+        return []
+    encontrados = set()
+    for m in _ERR_RE.finditer(content):
+        encontrados.add(m.group(1).decode().lower())
+        if len(encontrados) == len(ERROR_KEYWORDS):
+            break
+    return [word for word in ERROR_KEYWORDS if word in encontrados]
 
 def check_robots_txt(url):
     try:
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        r = requests.get(base + "/robots.txt", timeout=10)
+        r = get_session().get(base_url(url) + "/robots.txt", timeout=TIMEOUT)
         return r.status_code == 200
-    except Exception:
+    except Exception as e:
+        if eh_timeout(e):
+            registrar_timeout("robots.txt", url)
         return False
 
 def check_sitemap_xml(url):
     try:
-        parsed = urlparse(url)
-        base = f"{parsed.scheme}://{parsed.netloc}"
-        r = requests.get(base + "/sitemap.xml", timeout=10)
+        r = get_session().get(base_url(url) + "/sitemap.xml", timeout=TIMEOUT)
         return r.status_code == 200
-    except Exception:
+    except Exception as e:
+        if eh_timeout(e):
+            registrar_timeout("sitemap.xml", url)
         return False
 
-def check_meta_refresh(content):
+def check_meta_refresh(tree):
     try:
-        soup = BeautifulSoup(content, 'html.parser')
-        meta_refresh = soup.find('meta', attrs={'http-equiv': 'refresh'})
-        return meta_refresh is not None
+        return tree.css_first('meta[http-equiv="refresh" i]') is not None
     except Exception:
         return False
 
 # ==================== Funções Específicas para WordPress ====================
-def check_wordpress_features(content, base_url):
+def check_wordpress_features(content, tree, url):
     """
     Verifica características típicas de sites WordPress:
       - Presença de "wp-content" e "wp-includes" no HTML.
@@ -336,36 +560,36 @@ def check_wordpress_features(content, base_url):
     Retorna um dicionário com os resultados.
     """
     features = {}
-    text = ""
-    try:
-        text = content.decode('utf-8', errors='ignore').lower()
-    except Exception:
-        pass
+    # Busca direto nos bytes: um único lower(), sem decodificar o HTML
+    text = content.lower() if content else b""
 
-    features["wp_content"] = "wp-content" in text
-    features["wp_includes"] = "wp-includes" in text
+    features["wp_content"] = b"wp-content" in text
+    features["wp_includes"] = b"wp-includes" in text
 
     features["meta_generator"] = False
     try:
-        soup = BeautifulSoup(content, "html.parser")
-        meta = soup.find("meta", attrs={"name": "generator"})
-        if meta and "wordpress" in meta.get("content", "").lower():
+        meta = tree.css_first('meta[name="generator"]')
+        if meta is not None and "wordpress" in (meta.attributes.get("content") or "").lower():
             features["meta_generator"] = True
     except Exception:
         pass
 
     try:
-        wp_json_url = base_url.rstrip("/") + "/wp-json/"
-        r = requests.get(wp_json_url, timeout=10)
+        wp_json_url = base_url(url) + "/wp-json/"
+        r = get_session().get(wp_json_url, timeout=TIMEOUT)
         features["wp_json"] = (r.status_code == 200)
-    except Exception:
+    except Exception as e:
+        if eh_timeout(e):
+            registrar_timeout("wp-json", wp_json_url)
         features["wp_json"] = False
 
     try:
-        wp_admin_url = base_url.rstrip("/") + "/wp-admin/"
-        r = requests.get(wp_admin_url, timeout=10)
+        wp_admin_url = base_url(url) + "/wp-admin/"
+        r = get_session().get(wp_admin_url, timeout=TIMEOUT)
         features["wp_admin"] = (r.status_code in [200, 302]) and ("login" in r.text.lower())
-    except Exception:
+    except Exception as e:
+        if eh_timeout(e):
+            registrar_timeout("wp-admin", wp_admin_url)
         features["wp_admin"] = False
 
     return features
@@ -437,14 +661,25 @@ def medir_desempenho(resp_time):
         return 50
 
 # ==================== Novo Passo: Capturar Screenshot da Página Inicial ====================
-def take_screenshot(url, output_file):
-    from selenium import webdriver
-    from selenium.webdriver.chrome.options import Options
-    from selenium.webdriver.chrome.service import Service
-    from webdriver_manager.chrome import ChromeDriverManager
-    import os
-    import time
+def chromedriver_em_cache():
+    """Retorna o caminho do ChromeDriver salvo em execuções anteriores, se ainda existir."""
+    try:
+        with open(CHROMEDRIVER_CACHE, "r", encoding="utf-8") as f:
+            caminho = f.read().strip()
+    except OSError:
+        return None
+    return caminho if caminho and os.path.isfile(caminho) else None
+
+def salvar_chromedriver_em_cache(caminho):
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE), exist_ok=True)
+        with open(CHROMEDRIVER_CACHE, "w", encoding="utf-8") as f:
+            f.write(caminho)
+    except OSError:
+        pass
 
+def criar_driver():
+    """Cria uma instância do Chrome headless com as opções usadas para os prints."""
     # Silencia a saída do ChromeDriver
     os.environ["CHROME_DRIVER_SILENT_OUTPUT"] = "1"
 
@@ -452,17 +687,122 @@ def take_screenshot(url, output_file):
     options.add_argument("--headless")
     options.add_argument("--no-sandbox")
     options.add_argument("--disable-dev-shm-usage")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--disable-extensions")
     options.add_argument("window-size=1280,800")
     options.add_experimental_option('excludeSwitches', ['enable-logging'])
     options.add_argument("--log-level=3")
     options.add_argument("--disable-logging")
 
-    service = Service(ChromeDriverManager().install(), service_log_path=os.devnull)
-    driver = webdriver.Chrome(service=service, options=options)
-    driver.get(url)
-    time.sleep(2)  # Aguarda o carregamento da página
-    driver.save_screenshot(output_file)
-    driver.quit()
+    # Com o caminho do ChromeDriver em cache, o Selenium Manager (e sua consulta pela rede) é dispensado
+    caminho = chromedriver_em_cache()
+    if caminho is not None:
+        try:
+            return webdriver.Chrome(service=Service(caminho, service_log_path=os.devnull), options=options)
+        except Exception:
+            # Driver do cache incompatível (ex.: Chrome atualizado): descarta e localiza novamente
+            try:
+                os.remove(CHROMEDRIVER_CACHE)
+            except OSError:
+                pass
+    driver = webdriver.Chrome(service=Service(service_log_path=os.devnull), options=options)
+    salvar_chromedriver_em_cache(driver.service.path)
+    return driver
+
+class ScreenshotPool:
+    """
+    Conjunto de até `size` instâncias do Chrome headless, criadas sob demanda e reaproveitadas
+    entre os sites. Cada captura usa uma instância por vez, o que permite tirar vários prints
+    em paralelo.
+    """
+
+    def __init__(self, size=SCREENSHOT_WORKERS):
+        self.size = size
+        self._livres = queue.Queue()
+        self._drivers = []
+        self._lock = threading.Lock()
+
+    def _acquire(self):
+        try:
+            return self._livres.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            criar = len(self._drivers) < self.size
+            if criar:
+                self._drivers.append(None)  # reserva a vaga enquanto o Chrome inicia
+        if not criar:
+            return self._livres.get()
+        try:
+            driver = criar_driver()
+        except Exception:
+            with self._lock:
+                self._drivers.remove(None)
+            raise
+        with self._lock:
+            self._drivers[self._drivers.index(None)] = driver
+        return driver
+
+    def capture(self, url, output_file):
+        driver = self._acquire()
+        try:
+            driver.set_page_load_timeout(10)
+            driver.get(url)
+            try:
+                # Aguarda o carregamento da página
+                WebDriverWait(driver, 5).until(
+                    lambda d: d.execute_script("return document.readyState") == "complete")
+            except TimeoutException:
+                pass
+            driver.save_screenshot(output_file)
+        finally:
+            self._livres.put(driver)
+
+    def close(self):
+        with self._lock:
+            drivers, self._drivers = self._drivers, []
+        for driver in drivers:
+            if driver is None:
+                continue
+            try:
+                driver.quit()
+            except Exception:
+                pass
+
+SCREENSHOT_POOL = ScreenshotPool()
+atexit.register(SCREENSHOT_POOL.close)
+
+@functools.lru_cache(maxsize=None)
+def chrome_binary():
+    for nome in CHROME_BINARIOS:
+        caminho = shutil.which(nome)
+        if caminho:
+            return caminho
+    return None
+
+def take_screenshot(url, output_file):
+    """
+    Captura o print chamando o Chrome headless diretamente pela linha de comando, sem a
+    camada do WebDriver. Se o Chrome não estiver no PATH (comum no Windows), usa o Selenium.
+    """
+    chrome = chrome_binary()
+    if chrome is None:
+        SCREENSHOT_POOL.capture(url, output_file)
+        return
+    # Perfil temporário por chamada: instâncias simultâneas não disputam o mesmo perfil
+    with tempfile.TemporaryDirectory() as perfil:
+        subprocess.run([
+            chrome,
+            "--headless=new",
+            "--disable-gpu",
+            "--no-sandbox",
+            f"--user-data-dir={perfil}",
+            "--screenshot=" + os.path.abspath(output_file),
+            "--window-size=1280,800",
+            "--hide-scrollbars",
+            "--virtual-time-budget=5000",
+            url,
+        ], timeout=15, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
 
 def print_ascii_art():
     art = r"""
@@ -476,6 +816,231 @@ def print_ascii_art():
 """
     console.print(art)
 
+# ==================== Processamento Assíncrono dos Sites ====================
+def abrir_arquivo(caminho):
+    import platform
+    if platform.system() == "Windows":
+        os.startfile(caminho)
+    elif platform.system() == "Darwin":
+        subprocess.Popen(["open", caminho], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        # Popen não bloqueia o loop de eventos, mesmo se o xdg-open abrir o visualizador em primeiro plano
+        subprocess.Popen(["xdg-open", caminho], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+def capturar_print(url, screenshot_file, dominio_path):
+    """
+    Captura o print e tenta abri-lo automaticamente (opcional). Links do mesmo domínio
+    gravam o mesmo homepage.png, então as capturas de um domínio são feitas uma por vez.
+    """
+    with lock_do_dominio(dominio_path):
+        take_screenshot(url, screenshot_file)
+        abrir_arquivo(screenshot_file)
+
+async def process_site(url, limite, progress, task):
+    """
+    Executa os 16 passos de verificação de um site. As verificações de rede independentes
+    (página inicial, SSL, DNS, ping, robots.txt, sitemap.xml e endpoints WordPress) rodam
+    em paralelo; os demais passos reaproveitam a página inicial baixada uma única vez.
+    A barra de progresso avança conforme cada passo termina.
+    Retorna um dicionário com os dados necessários para exibir o resultado do site.
+    """
+    loop = asyncio.get_running_loop()
+
+    def avancar(passo, descricao):
+        progress.update(task, advance=1,
+            description=f"{url} - Passo {passo}/{TOTAL_PASSOS}: {descricao}")
+
+    async def passo(numero, descricao, func, *args):
+        if inspect.iscoroutinefunction(func):
+            resultado = await func(*args)
+        else:
+            resultado = await loop.run_in_executor(PROBE_EXECUTOR, func, *args)
+        avancar(numero, descricao)
+        return resultado
+
+    async def pagina_e_wordpress():
+        # O passo 13 depende do conteúdo baixado no passo 1
+        homepage = await passo(1, "Verificando disponibilidade", verificar_site, url)
+        tree = await loop.run_in_executor(PROBE_EXECUTOR, parse_html, homepage.content)
+        wp_features = await passo(13, "Verificando características WordPress",
+                                  check_wordpress_features, homepage.content, tree, url)
+        return homepage, tree, wp_features
+
+    async with limite:
+        progress.update(task, description=f"Processando site: {url}")
+        dominio_site = extrair_dominio(url)
+
+        # Passo 4: Verificar certificado SSL (se HTTPS)
+        if url.lower().startswith("https"):
+            passo_ssl = passo(4, "Verificando certificado SSL", check_ssl_certificate, dominio_site)
+        else:
+            passo_ssl = passo(4, "Verificando certificado SSL", lambda: (False, None))
+
+        (
+            (homepage, tree, wp_features),
+            (ssl_valid, ssl_expiry),
+            dns_ips,
+            ping_success,
+            robots,
+            sitemap,
+        ) = await asyncio.gather(
+            pagina_e_wordpress(),
+            passo_ssl,
+            passo(5, "Verificando DNS", check_dns_resolution, dominio_site),
+            passo(6, "Executando teste de ping", ping_host, dominio_site),
+            passo(10, "Verificando robots.txt", check_robots_txt, url),
+            passo(11, "Verificando sitemap.xml", check_sitemap_xml, url),
+        )
+
+        # Passos 2, 3, 7, 8, 9 e 12: análises locais sobre a página inicial já baixada
+        online = homepage.online
+        conteudo = homepage.content
+        resp_time = check_response_time(homepage)
+        avancar(2, "Medindo tempo de resposta")
+        redir_chain = check_redirection_chain(homepage)
+        avancar(3, "Verificando redirecionamentos")
+        content_type = get_content_type(homepage)
+        avancar(7, "Obtendo Content-Type")
+        page_title = get_page_title(tree)
+        avancar(8, "Extraindo título da página")
+        erros = check_error_patterns(conteudo)
+        avancar(9, "Verificando padrões de erro")
+        meta_refresh = check_meta_refresh(tree)
+        avancar(12, "Verificando meta refresh")
+
+        # Passo 14: Salvar conteúdo (controle de versões); páginas truncadas não geram versão
+        dominio_path = criar_pastas_necessarias(dominio_site)
+        conteudo_versao = conteudo if homepage.complete else None
+        novo_arquivo, total_versoes = await passo(14, "Salvando conteúdo",
+                                                  salvar_conteudo, dominio_path, conteudo_versao)
+
+        # Passo 15: Medir desempenho geral da página inicial
+        performance = medir_desempenho(resp_time)
+        avancar(15, "Medindo desempenho")
+
+        # Passo 16: Capturar screenshot da página inicial
+        print_folder = os.path.join(dominio_path, "print")
+        if not os.path.exists(print_folder):
+            os.makedirs(print_folder)
+        screenshot_file = os.path.join(print_folder, "homepage.png")
+        try:
+            await loop.run_in_executor(SCREENSHOT_EXECUTOR, capturar_print, url, screenshot_file, dominio_path)
+            screenshot_link = f"[link=file:///{screenshot_file.replace(os.sep, '/') }]{screenshot_file.replace(os.sep, '/') }[/link]"
+        except Exception as e:
+            screenshot_link = f"[red]Erro no print[/red]"
+            console.print(f"[red]Erro ao capturar screenshot: {e}[/red]")
+        avancar(16, "Capturando screenshot")
+
+    return {
+        "url": url,
+        "online": online,
+        "resp_time": resp_time,
+        "redir_chain": redir_chain,
+        "ssl_valid": ssl_valid,
+        "ssl_expiry": ssl_expiry,
+        "dns_ips": dns_ips,
+        "ping_success": ping_success,
+        "content_type": content_type,
+        "page_title": page_title,
+        "erros": erros,
+        "robots": robots,
+        "sitemap": sitemap,
+        "meta_refresh": meta_refresh,
+        "wp_features": wp_features,
+        "novo_arquivo": novo_arquivo,
+        "total_versoes": total_versoes,
+        "performance": performance,
+        "screenshot_link": screenshot_link,
+    }
+
+async def processar_sites(links, progress, task):
+    """
+    Agenda todos os sites e exibe o resultado de cada um assim que ele termina. Os painéis
+    são impressos apenas por esta tarefa (o Rich não é thread-safe).
+    """
+    limite = asyncio.Semaphore(MAX_SITES_SIMULTANEOS)
+    tasks = [asyncio.create_task(process_site(url, limite, progress, task)) for url in links]
+    for fut in asyncio.as_completed(tasks):
+        resultado = await fut
+        render_panel(resultado)
+
+# ==================== Exibição dos Resultados ====================
+def render_panel(resultado):
+    url = resultado["url"]
+    resp_time = resultado["resp_time"]
+    redir_chain = resultado["redir_chain"]
+    ssl_valid = resultado["ssl_valid"]
+    dns_ips = resultado["dns_ips"]
+    ping_success = resultado["ping_success"]
+    erros = resultado["erros"]
+    wp_features = resultado["wp_features"]
+
+    # Monta os dados para exibição dos resultados do site
+    site_status = "[green]ONLINE[/green]" if resultado["online"] else "[red]OFFLINE[/red]"
+    redir_str = f"[grey]{len(redir_chain)}[/grey]"
+    if url.lower().startswith("https"):
+        ssl_str = f"[green]Válido (expira: {resultado['ssl_expiry']})[/green]" if ssl_valid else "[red]Inválido/N/A[/red]"
+    else:
+        ssl_str = "[grey]N/A[/grey]"
+    dns_str = f"[grey]{', '.join(dns_ips)}[/grey]" if dns_ips else "[grey]N/A[/grey]"
+    ping_str = "[green]Sucesso[/green]" if ping_success else "[red]Falha[/red]"
+    resp_time_str = f"[grey]{resp_time:.2f} s[/grey]" if resp_time is not None else "[grey]N/A[/grey]"
+    erros_str = f"[red]{', '.join(erros)}[/red]" if erros else "[green]Nenhum[/green]"
+    nova_versao = "[green]Sim[/green]" if resultado["novo_arquivo"] is not None else "[grey]Não[/grey]"
+
+    # Tabela de verificações gerais
+    table = Table(title=f"Detalhes da verificação para: [cyan]{url}[/cyan]", box=box.DOUBLE_EDGE)
+    table.add_column("Item", style="bold", no_wrap=True)
+    table.add_column("Resultado", style="dim")
+    table.add_row("Status", site_status)
+    table.add_row("Tempo de Resposta", resp_time_str)
+    table.add_row("Redirecionamentos", redir_str)
+    table.add_row("Certificado SSL", ssl_str)
+    table.add_row("DNS", dns_str)
+    table.add_row("Ping", ping_str)
+    table.add_row("Content-Type", f"[grey]{resultado['content_type']}[/grey]")
+    table.add_row("Título", f"[grey]{resultado['page_title']}[/grey]")
+    table.add_row("Erros no Conteúdo", erros_str)
+    table.add_row("robots.txt", "[green]Encontrado[/green]" if resultado["robots"] else "[orange]Não encontrado[/orange]")
+    table.add_row("sitemap.xml", "[green]Encontrado[/green]" if resultado["sitemap"] else "[orange]Não encontrado[/orange]")
+    table.add_row("Meta Refresh", "[red]Detectado[/red]" if resultado["meta_refresh"] else "[green]Não detectado[/green]")
+    table.add_row("Nova Versão", nova_versao)
+    table.add_row("Número de Versões", f"[orange]{resultado['total_versoes']}[/orange]")
+    table.add_row("Desempenho", f"[bold]{resultado['performance']}%[/bold]")
+    table.add_row("Print", resultado["screenshot_link"])
+
+    # Tabela de verificações específicas para WordPress
+    wp_table = Table(title="Verificações WordPress", box=box.SIMPLE)
+    wp_table.add_column("Item", style="bold", no_wrap=True)
+    wp_table.add_column("Resultado", style="dim")
+    wp_table.add_row("wp-content", "[green]Encontrado[/green]" if wp_features.get("wp_content") else "[red]Não encontrado[/red]")
+    wp_table.add_row("wp-includes", "[green]Encontrado[/green]" if wp_features.get("wp_includes") else "[red]Não encontrado[/red]")
+    wp_table.add_row("Meta Generator", "[green]WordPress detectado[/green]" if wp_features.get("meta_generator") else "[red]Não detectado[/red]")
+    wp_table.add_row("WP-JSON", "[green]Acessível[/green]" if wp_features.get("wp_json") else "[red]Indisponível[/red]")
+    wp_table.add_row("WP-Admin", "[green]Página de Login Detectada[/green]" if wp_features.get("wp_admin") else "[red]Não detectada[/red]")
+
+    score = compute_score(resultado["online"], resp_time, redir_chain, url, ssl_valid, dns_ips, ping_success,
+                          resultado["content_type"], resultado["page_title"], erros,
+                          resultado["robots"], resultado["sitemap"], resultado["meta_refresh"])
+    if score <= 40:
+        score_style = "bold red"
+    elif score <= 90:
+        score_style = "bold yellow"
+    else:
+        score_style = "bold green"
+
+    painel_conteudo = Panel.fit(
+        table,
+        title=f"Nota Final: [ {score} % ]",
+        subtitle=f"[{score_style}]{score}%[/{score_style}]",
+        border_style=score_style
+    )
+    painel_wp = Panel.fit(wp_table, title="WordPress", border_style="blue")
+
+    console.print(painel_conteudo)
+    console.print(painel_wp)
+    console.rule()
+
 # ==================== Função Principal ====================
 def main():
     os.system('cls' if os.name == 'nt' else 'clear')
@@ -488,208 +1053,25 @@ def main():
         sys.exit(1)
     
     # Barra de progresso geral: total_steps_overall = total_sites * 16 (16 passos por site)
-    total_steps_overall = total_links * 16
-    with Progress(
-        SpinnerColumn(),
-        BarColumn(),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}% - {task.description}"),
-        TimeElapsedColumn()
-    ) as overall_progress:
-        overall_task = overall_progress.add_task("Processando sites...", total=total_steps_overall)
-        
-        # Processa cada site individualmente
-        for url in links:
-            overall_progress.update(overall_task, description=f"Processando site: {url}")
-            
-            # Passo 1: Verificar disponibilidade do site
-            online, conteudo = verificar_site(url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 1/16: Verificando disponibilidade")
-            time.sleep(0.1)
-            
-            # Passo 2: Medir tempo de resposta
-            resp_time, r_resp = check_response_time(url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 2/16: Medindo tempo de resposta")
-            time.sleep(0.1)
-            
-            # Passo 3: Verificar redirecionamentos
-            redir_chain = check_redirection_chain(url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 3/16: Verificando redirecionamentos")
-            time.sleep(0.1)
-            
-            # Passo 4: Verificar certificado SSL (se HTTPS)
-            if url.lower().startswith("https"):
-                ssl_valid, ssl_expiry = check_ssl_certificate(extrair_dominio(url))
-            else:
-                ssl_valid = False
-                ssl_expiry = None
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 4/16: Verificando certificado SSL")
-            time.sleep(0.1)
-            
-            # Passo 5: Verificar DNS
-            dns_ips = check_dns_resolution(extrair_dominio(url))
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 5/16: Verificando DNS")
-            time.sleep(0.1)
-            
-            # Passo 6: Teste de ping
-            ping_success = ping_host(extrair_dominio(url))
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 6/16: Executando teste de ping")
-            time.sleep(0.1)
-            
-            # Passo 7: Obter Content-Type
-            content_type = get_content_type(r_resp)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 7/16: Obtendo Content-Type")
-            time.sleep(0.1)
-            
-            # Passo 8: Obter título da página
-            page_title = get_page_title(conteudo)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 8/16: Extraindo título da página")
-            time.sleep(0.1)
-            
-            # Passo 9: Verificar padrões de erro
-            erros = check_error_patterns(conteudo)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 9/16: Verificando padrões de erro")
-            time.sleep(0.1)
-            
-            # Passo 10: Verificar robots.txt
-            robots = check_robots_txt(url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 10/16: Verificando robots.txt")
-            time.sleep(0.1)
-            
-            # Passo 11: Verificar sitemap.xml
-            sitemap = check_sitemap_xml(url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 11/16: Verificando sitemap.xml")
-            time.sleep(0.1)
-            
-            # Passo 12: Verificar meta refresh
-            meta_refresh = check_meta_refresh(conteudo)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 12/16: Verificando meta refresh")
-            time.sleep(0.1)
-            
-            # Passo 13: Verificações específicas para WordPress
-            base_url = url if url.startswith("http") else "http://" + url
-            wp_features = check_wordpress_features(conteudo, base_url)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 13/16: Verificando características WordPress")
-            time.sleep(0.1)
-            
-            # Passo 14: Salvar conteúdo (controle de versões)
-            dominio_site = extrair_dominio(url)
-            dominio_path = criar_pastas_necessarias(dominio_site)
-            novo_arquivo, total_versoes = salvar_conteudo(dominio_path, conteudo)
-            nova_versao = "[green]Sim[/green]" if novo_arquivo is not None else "[grey]Não[/grey]"
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 14/16: Salvando conteúdo")
-            time.sleep(0.1)
-            
-            # Passo 15: Medir desempenho geral da página inicial
-            performance = medir_desempenho(resp_time)
-            overall_progress.update(overall_task, advance=1, 
-                description=f"{url} - Passo 15/16: Medindo desempenho")
-            time.sleep(0.1)
-            
-            # Passo 16: Capturar screenshot da página inicial
-            dominio_site = extrair_dominio(url)
-            dominio_path = criar_pastas_necessarias(dominio_site)
-            print_folder = os.path.join(dominio_path, "print")
-            if not os.path.exists(print_folder):
-                os.makedirs(print_folder)
-            screenshot_file = os.path.join(print_folder, "homepage.png")
-            try:
-                take_screenshot(url, screenshot_file)
-                screenshot_link = f"[link=file:///{screenshot_file.replace(os.sep, '/') }]{screenshot_file.replace(os.sep, '/') }[/link]"
-                # Tenta abrir automaticamente o screenshot (opcional)
-                import platform
-                if platform.system() == "Windows":
-                    os.startfile(screenshot_file)
-                elif platform.system() == "Darwin":
-                    subprocess.call(["open", screenshot_file])
-                else:
-                    subprocess.call(["xdg-open", screenshot_file])
-            except Exception as e:
-                screenshot_link = f"[red]Erro no print[/red]"
-                console.print(f"[red]Erro ao capturar screenshot: {e}[/red]")
-            time.sleep(0.1)
-            
-            # Aguarda um instante antes de prosseguir para o próximo site
-            time.sleep(0.2)
-            
-            # Monta os dados para exibição dos resultados do site
-            site_status = "[green]ONLINE[/green]" if online else "[red]OFFLINE[/red]"
-            redir_str = f"[grey]{len(redir_chain)}[/grey]"
-            if url.lower().startswith("https"):
-                ssl_str = f"[green]Válido (expira: {ssl_expiry})[/green]" if ssl_valid else "[red]Inválido/N/A[/red]"
-            else:
-                ssl_str = "[grey]N/A[/grey]"
-            dns_str = f"[grey]{', '.join(dns_ips)}[/grey]" if dns_ips else "[grey]N/A[/grey]"
-            ping_str = "[green]Sucesso[/green]" if ping_success else "[red]Falha[/red]"
-            resp_time_str = f"[grey]{resp_time:.2f} s[/grey]" if resp_time is not None else "[grey]N/A[/grey]"
-            erros_str = f"[red]{', '.join(erros)}[/red]" if erros else "[green]Nenhum[/green]"
-            
-            # Tabela de verificações gerais
-            table = Table(title=f"Detalhes da verificação para: [cyan]{url}[/cyan]", box=box.DOUBLE_EDGE)
-            table.add_column("Item", style="bold", no_wrap=True)
-            table.add_column("Resultado", style="dim")
-            table.add_row("Status", site_status)
-            table.add_row("Tempo de Resposta", resp_time_str)
-            table.add_row("Redirecionamentos", redir_str)
-            table.add_row("Certificado SSL", ssl_str)
-            table.add_row("DNS", dns_str)
-            table.add_row("Ping", ping_str)
-            table.add_row("Content-Type", f"[grey]{content_type}[/grey]")
-            table.add_row("Título", f"[grey]{page_title}[/grey]")
-            table.add_row("Erros no Conteúdo", erros_str)
-            table.add_row("robots.txt", "[green]Encontrado[/green]" if robots else "[orange]Não encontrado[/orange]")
-            table.add_row("sitemap.xml", "[green]Encontrado[/green]" if sitemap else "[orange]Não encontrado[/orange]")
-            table.add_row("Meta Refresh", "[red]Detectado[/red]" if meta_refresh else "[green]Não detectado[/green]")
-            table.add_row("Nova Versão", nova_versao)
-            table.add_row("Número de Versões", f"[orange]{total_versoes}[/orange]")
-            table.add_row("Desempenho", f"[bold]{performance}%[/bold]")
-            table.add_row("Print", screenshot_link)
-            
-            # Tabela de verificações específicas para WordPress
-            wp_table = Table(title="Verificações WordPress", box=box.SIMPLE)
-            wp_table.add_column("Item", style="bold", no_wrap=True)
-            wp_table.add_column("Resultado", style="dim")
-            wp_table.add_row("wp-content", "[green]Encontrado[/green]" if wp_features.get("wp_content") else "[red]Não encontrado[/red]")
-            wp_table.add_row("wp-includes", "[green]Encontrado[/green]" if wp_features.get("wp_includes") else "[red]Não encontrado[/red]")
-            wp_table.add_row("Meta Generator", "[green]WordPress detectado[/green]" if wp_features.get("meta_generator") else "[red]Não detectado[/red]")
-            wp_table.add_row("WP-JSON", "[green]Acessível[/green]" if wp_features.get("wp_json") else "[red]Indisponível[/red]")
-            wp_table.add_row("WP-Admin", "[green]Página de Login Detectada[/green]" if wp_features.get("wp_admin") else "[red]Não detectada[/red]")
-            
-            score = compute_score(online, resp_time, redir_chain, url, ssl_valid, dns_ips, ping_success,
-                                  content_type, page_title, erros, robots, sitemap, meta_refresh)
-            if score <= 40:
-                score_style = "bold red"
-            elif score <= 90:
-                score_style = "bold yellow"
-            else:
-                score_style = "bold green"
-            
-            painel_conteudo = Panel.fit(
-                table,
-                title=f"Nota Final: [ {score} % ]",
-                subtitle=f"[{score_style}]{score}%[/{score_style}]",
-                border_style=score_style
-            )
-            painel_wp = Panel.fit(wp_table, title="WordPress", border_style="blue")
+    total_steps_overall = total_links * TOTAL_PASSOS
+    try:
+        with Progress(
+            SpinnerColumn(),
+            BarColumn(),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}% - {task.description}"),
+            TimeElapsedColumn(),
+            refresh_per_second=10
+        ) as overall_progress:
+            overall_task = overall_progress.add_task("Processando sites...", total=total_steps_overall)
             
-            console.print(painel_conteudo)
-            console.print(painel_wp)
-            console.rule()
-            time.sleep(0.5)
-    
+            # Processa os sites em paralelo (limitado a MAX_SITES_SIMULTANEOS por vez),
+            # exibindo cada resultado conforme o site termina
+            asyncio.run(processar_sites(links, overall_progress, overall_task))
+    finally:
+        fechar_sessoes()
+        PROBE_EXECUTOR.shutdown(wait=False)
+        SCREENSHOT_EXECUTOR.shutdown(wait=False)
+
     console.rule("[bold cyan]Processo finalizado[/bold cyan]")
 
 if __name__ == "__main__":